@@ -0,0 +1,235 @@
+# coding=utf8
+"""Differential fuzzing of slugify engines against the reference Slugify.
+
+Usage:
+python -m slugify.fuzz --engine mypackage.engines:make_fast_slugify
+
+An engine is a callable taking a configured Slugify instance and returning
+a callable with the same signature (text, **kwargs). Every predefined
+instance and a number of randomly configured ones are run through both
+paths on the same generated inputs; any divergence is reported along with
+the throughput of each path.
+"""
+
+import copy
+import random
+import sys
+from optparse import OptionParser
+from timeit import default_timer
+
+from unidecode import unidecode
+
+import slugify as predefined
+from slugify.main import Slugify, UniqueSlugify
+from slugify.alt_translates import CYRILLIC, GERMAN, GREEK
+
+
+PREDEFINED = ('slugify', 'slugify_unicode', 'slugify_url', 'slugify_filename',
+              'slugify_ru', 'slugify_de', 'slugify_el', 'unique_slugify')
+
+ALPHABETS = (
+    u'abcdefghijklmnopqrstuvwxyz',
+    u'àáâäçéèêëíîïñóôöúùûüßøåæœšžčćđ',
+    u'абвгдеёжзийклмнопрстуфхцчшщъыьэюя',
+    u'αβγδεζηθικλμνξοπρστυφχψωύϋΰ',
+    u'北亰中国人',
+    u'0123456789',
+)
+# plain spaces half the time; otherwise apostrophes, ellipsis, \p{Term} marks and the commas excluded from them
+PUNCTUATION = (
+    u' ',
+    u" .,;:!?…'\"-_–—()[]/%#*№،﹐，。！？",
+)
+
+SAFE_CHARS = ('', "'", '-.', '_', '*', '.')
+STOP_WORDS = ((), ('a', 'the'), ('a', 'an', 'the'), ('x', 'y'))
+PRETRANSLATE = (('None', None), ('CYRILLIC', CYRILLIC), ('GERMAN', GERMAN), ('GREEK', GREEK))
+SEPARATORS = (u'-', u'_', u'.', u'...', u'')
+
+
+def random_word(rnd):
+    word = u''.join(rnd.choice(rnd.choice(ALPHABETS)) for _ in range(rnd.randint(1, 8)))
+    case = rnd.randint(0, 3)   # uppercase runs exercise UPPER_TO_UPPER_LETTERS_RE
+    if case == 1:
+        word = word.upper()
+    elif case == 2:
+        word = word.capitalize()
+    return word
+
+
+def random_text(rnd, max_words=10):
+    words = []
+    for _ in range(rnd.randint(0, max_words)):
+        if rnd.random() < 0.15:
+            words.append(rnd.choice(('a', 'an', 'The', 'x', 'Y')))
+        else:
+            words.append(random_word(rnd))
+        words.append(u''.join(rnd.choice(rnd.choice(PUNCTUATION)) for _ in range(rnd.randint(1, 3))))
+
+    text = u''.join(words)
+    if rnd.random() < 0.1:
+        text = text.encode('utf8')   # byte strings are decoded by Slugify.__call__
+    return text
+
+
+def random_kwargs(rnd):
+    kwargs = {}
+    if rnd.random() < 0.3:
+        kwargs['to_lower'] = rnd.random() < 0.5
+    if rnd.random() < 0.3:
+        kwargs['max_length'] = rnd.randint(1, 60)
+    if rnd.random() < 0.3:
+        kwargs['separator'] = rnd.choice(SEPARATORS)
+    if rnd.random() < 0.3:
+        kwargs['capitalize'] = rnd.random() < 0.5
+    return kwargs
+
+
+def random_slugify(rnd):
+    """Return a randomly configured Slugify and a description of its settings"""
+
+    pretranslate_name, pretranslate = rnd.choice(PRETRANSLATE)
+    translate = rnd.choice((unidecode, None))
+    settings = [
+        ('safe_chars', rnd.choice(SAFE_CHARS)),
+        ('stop_words', rnd.choice(STOP_WORDS)),
+        ('to_lower', rnd.random() < 0.5),
+        ('max_length', rnd.choice((2000, 255, 100, rnd.randint(1, 60)))),
+        ('min_length', rnd.randint(0, 40)),
+        ('separator', rnd.choice(SEPARATORS)),
+        ('capitalize', rnd.random() < 0.5),
+        ('extract_phrase', rnd.random() < 0.3),
+        ('truncate_words', rnd.random() < 0.5),
+    ]
+
+    slugify = Slugify(pretranslate=dict(pretranslate) if pretranslate else None, translate=translate,
+                      **dict(settings))
+
+    description = [u'pretranslate: {0}'.format(pretranslate_name),
+                   u'translate: {0}'.format(translate.__name__ if translate else None)]
+    description += [u'{0}: {1!r}'.format(key, value) for key, value in settings]
+    return slugify, u'{%s}' % u', '.join(description)
+
+
+def call(func, text, kwargs):
+    try:
+        return func(text, **kwargs)
+    except Exception as error:
+        # an exception is an outcome too: the engine must raise where the reference raises
+        return error.__class__
+
+
+def fresh(instance):
+    # UniqueSlugify output depends on the uids seen so far: start every pass from the same state
+    # and leave the original instance untouched
+    return copy.deepcopy(instance) if isinstance(instance, UniqueSlugify) else instance
+
+
+def results(func, cases):
+    return [call(func, text, kwargs) for text, kwargs in cases]
+
+
+def elapsed(func, cases):
+    start = default_timer()
+    results(func, cases)
+    return default_timer() - start
+
+
+class Report(object):
+
+    def __init__(self, name, cases, instance, engine):
+        self.name = name
+
+        reference_results = results(fresh(instance), cases)
+        candidate_results = results(engine(fresh(instance)), cases)
+
+        # time on a second pass so both paths run with warm caches
+        self.reference_time = elapsed(fresh(instance), cases)
+        self.candidate_time = elapsed(engine(fresh(instance)), cases)
+
+        self.calls = len(cases)
+        self.divergences = [
+            (text, kwargs, expected, result)
+            for (text, kwargs), expected, result in zip(cases, reference_results, candidate_results)
+            if expected != result
+        ]
+
+    @staticmethod
+    def rate(calls, seconds):
+        return calls / seconds if seconds else float('inf')
+
+    def __str__(self):
+        lines = [u'{0}: {1} calls, {2} divergences, reference {3:.0f}/s, candidate {4:.0f}/s'.format(
+            self.name, self.calls, len(self.divergences),
+            self.rate(self.calls, self.reference_time), self.rate(self.calls, self.candidate_time))]
+
+        for text, kwargs, expected, result in self.divergences:
+            lines.append(u'    {0!r} {1!r}: {2!r} != {3!r}'.format(text, kwargs, expected, result))
+
+        return u'\n'.join(lines)
+
+
+def run(engine=copy.deepcopy, iterations=200, configs=20, seed=0):
+    """Run predefined and randomly configured instances through the reference and the engine"""
+
+    rnd = random.Random(seed)
+    instances = [(name, getattr(predefined, name)) for name in PREDEFINED]
+    for number in range(configs):
+        slugify, settings = random_slugify(rnd)
+        instances.append((u'random config #{0} {1}'.format(number, settings), slugify))
+
+    reports = []
+    for name, instance in instances:
+        cases = [(random_text(rnd), random_kwargs(rnd)) for _ in range(iterations)]
+        if cases:
+            # repeated inputs exercise the numeric suffixes of UniqueSlugify
+            cases += [rnd.choice(cases) for _ in range(iterations // 10 or 1)]
+        reports.append(Report(name, cases, instance, engine))
+
+    return reports
+
+
+def load_engine(path):
+    module_name, colon, attr = path.partition(':')
+    if not (module_name and colon and attr):
+        raise ValueError(u"Engine must be given as module:attribute. Not {0!r}".format(path))
+
+    try:
+        __import__(module_name)
+    except ImportError as error:
+        raise ValueError(u"Can't import engine module {0!r}: {1}".format(module_name, error))
+
+    engine = getattr(sys.modules[module_name], attr, None)
+    if not callable(engine):
+        raise ValueError(u"Engine {0!r} is not a callable in module {1!r}".format(attr, module_name))
+
+    return engine
+
+
+def main(argv=None):
+    parser = OptionParser(usage='%prog [options]')
+    parser.add_option('-e', '--engine', help='engine factory as module:attribute (default: copy of reference)')
+    parser.add_option('-n', '--iterations', type='int', default=200, help='inputs per instance')
+    parser.add_option('-c', '--configs', type='int', default=20, help='randomly configured instances')
+    parser.add_option('-s', '--seed', type='int', default=0)
+    options, args = parser.parse_args(argv)
+
+    if args:
+        parser.error(u'unexpected arguments: {0}'.format(u' '.join(args)))
+
+    try:
+        engine = load_engine(options.engine) if options.engine else copy.deepcopy
+    except ValueError as error:
+        parser.error(error)
+    reports = run(engine, options.iterations, options.configs, options.seed)
+
+    print(u'seed {0}, {1} inputs per instance, {2} random configs'.format(
+        options.seed, options.iterations, options.configs))
+    for report in reports:
+        print(report)
+
+    return 1 if any(report.divergences for report in reports) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
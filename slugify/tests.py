@@ -1,5 +1,6 @@
 # coding=utf8
 
+import copy
 import unittest
 
 from slugify import Slugify, UniqueSlugify
@@ -8,6 +9,7 @@ from slugify import slugify_url, slugify_filename
 from slugify import slugify_ru, slugify_de, slugify_el
 
 from slugify import get_slugify
+from slugify import fuzz
 
 
 class SlugifyTestCase(unittest.TestCase):
@@ -241,6 +243,44 @@ class UniqueTestCase(unittest.TestCase):
         self.assertEqual(slugify('- - -This -- is another ## test ---', separator='_'), 'This_is_another_test_1')
 
 
+class FuzzTestCase(unittest.TestCase):
+
+    def test_copy_engine_matches_reference(self):
+        reports = fuzz.run(iterations=20, configs=5)
+        self.assertEqual(len(reports), len(fuzz.PREDEFINED) + 5)
+        self.assertEqual([report.divergences for report in reports], [[]] * len(reports))
+
+    def test_divergent_engine_is_reported(self):
+        engine = lambda reference: lambda text, **kwargs: reference(text, **kwargs).lower()
+        reports = fuzz.run(engine, iterations=20, configs=0)
+        self.assertTrue(any(report.divergences for report in reports))
+
+        text, kwargs, expected, result = reports[0].divergences[0]
+        self.assertEqual(expected.lower(), result)
+        self.assertIn(repr(result), str(reports[0]))
+
+    def test_random_config_settings_are_reported(self):
+        reports = fuzz.run(iterations=1, configs=1)
+        self.assertTrue(reports[-1].name.startswith('random config #0 {pretranslate: '))
+        self.assertIn("safe_chars: ", reports[-1].name)
+        self.assertIn("truncate_words: ", str(reports[-1]))
+
+    def test_load_engine(self):
+        self.assertIs(fuzz.load_engine('copy:deepcopy'), copy.deepcopy)
+
+        for path in ('copy', 'copy:', ':deepcopy', 'no_such_module:engine', 'copy:no_such_engine', 'copy:__name__'):
+            self.assertRaises(ValueError, fuzz.load_engine, path)
+
+    def test_unique_slugify_suffixes_are_checked(self):
+        uids = list(unique_slugify.uids)
+        engine = lambda reference: lambda text, **kwargs: Slugify.__call__(reference, text, **kwargs)
+        reports = fuzz.run(engine, iterations=20, configs=0)
+
+        self.assertEqual(reports[-1].name, 'unique_slugify')
+        self.assertTrue(reports[-1].divergences)
+        self.assertEqual(unique_slugify.uids, uids)
+
+
 class DeprecationTestCase(unittest.TestCase):
 
     def test_deprecated_get_slugify(self):